@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import numpy as np
 import cv2
 
-from typing import List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Tuple
 from enum import Enum
 
 class FlashFilter:
@@ -54,11 +54,35 @@ class FlashFilter:
         
         return []
 
-def _mean_pixel_distance(left: np.ndarray, right: np.ndarray) -> float:
-    assert len(left.shape) == 2 and len(right.shape) == 2
-    assert left.shape == right.shape
+def _mean_channel_distances(
+    left: np.ndarray,
+    right: np.ndarray,
+    diff: np.ndarray,
+) -> Tuple[float, float, float, float]:
+    """
+    Mean absolute difference of each channel of two images, computed in a single pass.
+    The per-pixel difference is written to `diff`.
+    """
+    assert left.shape == right.shape == diff.shape
     num_pixels: float = float(left.shape[0] * left.shape[1])
-    return (np.sum(np.abs(left.astype(np.int32) - right.astype(np.int32))) / num_pixels)
+    sums = cv2.sumElems(cv2.absdiff(left, right, dst=diff))
+    return (sums[0] / num_pixels, sums[1] / num_pixels, sums[2] / num_pixels, sums[3] / num_pixels)
+
+def _block_sad(integral: np.ndarray, y1, x1, y2, x2) -> np.ndarray:
+    """
+    Sum of absolute differences over the block [y1, y2) x [x1, x2) of each channel,
+    looked up from the integral image of a frame difference. The corners may also be
+    index arrays, which looks up many blocks at once.
+    """
+    return integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]
+
+def _value_channel(frame_img: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    HSV value channel (V = max(B, G, R)) of a BGR image, without computing hue or saturation.
+    Reads the channels as strided views so no per-channel planes are allocated.
+    """
+    np.maximum(frame_img[..., 0], frame_img[..., 1], out=dst)
+    return np.maximum(dst, frame_img[..., 2], out=dst)
 
 class ContentDetector:
 
@@ -70,11 +94,11 @@ class ContentDetector:
     
     @dataclass
     class _FrameData:
-        hue: np.ndarray
-        sat: np.ndarray
-        lum: np.ndarray
+        # HxWx3 HSV image, or only an HxW V (or decoded Y) plane in luma-only mode.
+        hsv: np.ndarray
     
     DEFAULT_COMPONENT_WEIGHTS = Components()
+    LUMA_ONLY_WEIGHTS = Components(delta_hue=0.0, delta_sat=0.0, delta_lum=1.0, delta_edges=0.0)
 
     def __init__(
         self,
@@ -82,13 +106,77 @@ class ContentDetector:
         min_scene_len: int = 15,
         weights: 'ContentDetector.Components' = DEFAULT_COMPONENT_WEIGHTS,
         filter_mode: FlashFilter.Mode = FlashFilter.Mode.MERGE,
+        luma_only: bool = False,
+        row_stride: int = 1,
+        decoded_luma: bool = False,
     ):
         self._threshold: float = threshold
         self._min_scene_len: int = min_scene_len
-        self._weights: ContentDetector.Components = weights
+        self._weights: ContentDetector.Components = (
+            ContentDetector.LUMA_ONLY_WEIGHTS if luma_only else weights)
+        self._hue_weight: float = self._weights.delta_hue
+        self._sat_weight: float = self._weights.delta_sat
+        self._lum_weight: float = self._weights.delta_lum
+        self._weight_norm: float = sum(abs(weight) for weight in self._weights)
+        # Hue and saturation are only computed if they contribute to the score.
+        self._luma_only: bool = self._weights.delta_hue == 0.0 and self._weights.delta_sat == 0.0
+        # Opt-in to scoring the decoder's luma (Y) plane instead of V. Y differs from V, so
+        # scores (and the tuned threshold) are not comparable with the default.
+        self._decoded_luma: bool = self._luma_only and decoded_luma
+        # Only every row_stride-th row of each frame is scored. Skipping rows is a
+        # zero-copy view for OpenCV, unlike column striding which forces a copy.
+        self._row_stride: int = row_stride
         self._last_frame: Optional[ContentDetector._FrameData] = None
+        # Two HSV buffers used alternately for the current and previous frame.
+        self._hsv_buffers: List[np.ndarray] = []
+        self._hsv_index: int = 0
+        # Reused buffer for the absolute difference between the last two frames, and its
+        # integral image which is only computed on demand by changed_block_ratio.
+        self._diff: Optional[np.ndarray] = None
+        self._diff_integral: Optional[np.ndarray] = None
         self._flash_filter = FlashFilter(mode=filter_mode, length=min_scene_len)
     
+    @property
+    def luma_only(self) -> bool:
+        """
+        True if only luminance contributes to the score. The luminance is the HSV value
+        channel (V = max(B, G, R)) of BGR frames, whichever backend decoded them.
+        """
+        return self._luma_only
+
+    @property
+    def decoded_luma(self) -> bool:
+        """
+        True if this luma-only detector takes single channel frames holding the decoder's
+        luma (Y) plane, letting the backend skip the conversion to BGR. Y is not V, so
+        scores differ from those of BGR frames and depend on the backend.
+        """
+        return self._decoded_luma
+
+    def changed_block_ratio(self, block_size: int = 64) -> float:
+        """
+        Fraction of the block_size x block_size blocks (smaller at the right and bottom
+        edges) whose score between the last two processed frames is above the threshold.
+        Blocks are scored like whole frames, each one with a constant number of lookups
+        in the integral image of the frame difference.
+        """
+        if self._diff is None:
+            return 0.0
+        if self._diff_integral is None:
+            self._diff_integral = cv2.integral(self._diff)
+        height, width = self._diff.shape[:2]
+        rows = np.append(np.arange(0, height, block_size), height)
+        cols = np.append(np.arange(0, width, block_size), width)
+        sads = _block_sad(self._diff_integral,
+                          rows[:-1, None], cols[None, :-1], rows[1:, None], cols[None, 1:])
+        if self._luma_only:
+            weighted = sads * self._lum_weight
+        else:
+            weighted = sads @ np.array([self._hue_weight, self._sat_weight, self._lum_weight])
+        areas = np.diff(rows)[:, None] * np.diff(cols)[None, :]
+        block_scores = weighted / (areas * self._weight_norm)
+        return float(np.mean(block_scores > self._threshold))
+
     def process_frame(self, frame_num: int, frame_img: np.ndarray) -> List[int]:
         self._frame_score = self._calculate_frame_score(frame_num, frame_img)
         if self._frame_score is None:
@@ -97,22 +185,42 @@ class ContentDetector:
         is_above_threshold = self._frame_score > self._threshold
         return self._flash_filter.filter(frame_num=frame_num, above_threshold=is_above_threshold)
     
+    def _next_hsv_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        if not self._hsv_buffers or self._hsv_buffers[0].shape != shape:
+            self._hsv_buffers = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
+        self._hsv_index ^= 1
+        return self._hsv_buffers[self._hsv_index]
+
     def _calculate_frame_score(self, frame_num: int, frame_img: np.ndarray) -> float:
-        hue, sat, lum = cv2.split(cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV))
+        if self._row_stride > 1:
+            frame_img = frame_img[::self._row_stride]
+        if self._decoded_luma and frame_img.ndim == 2:
+            # Luma plane decoded directly (e.g. Y of YUV video), used in place of V.
+            hsv = self._next_hsv_buffer(frame_img.shape)
+            np.copyto(hsv, frame_img)
+        elif self._luma_only:
+            hsv = _value_channel(frame_img, dst=self._next_hsv_buffer(frame_img.shape[:2]))
+        else:
+            hsv = self._next_hsv_buffer(frame_img.shape)
+            cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV, dst=hsv)
 
         if self._last_frame is None:
-            self._last_frame = ContentDetector._FrameData(hue, sat, lum)
+            self._last_frame = ContentDetector._FrameData(hsv)
             return 0.0
         
-        score_components = ContentDetector.Components(
-            delta_hue=_mean_pixel_distance(hue, self._last_frame.hue),
-            delta_sat=_mean_pixel_distance(sat, self._last_frame.sat),
-            delta_lum=_mean_pixel_distance(lum, self._last_frame.lum),
-        )
+        if self._diff is None or self._diff.shape != hsv.shape:
+            self._diff = np.empty_like(hsv)
+        self._diff_integral = None
+        distances = _mean_channel_distances(hsv, self._last_frame.hsv, self._diff)
+        if self._luma_only:
+            delta_hue, delta_sat, delta_lum = 0.0, 0.0, distances[0]
+        else:
+            delta_hue, delta_sat, delta_lum = distances[:3]
 
+        # Edge differences are not computed, so delta_edges never contributes.
         frame_score: float = (
-            sum(component * weight for (component, weight) in zip(score_components, self._weights))
-            / sum(abs(weight) for weight in self._weights))
+            delta_hue * self._hue_weight + delta_sat * self._sat_weight
+            + delta_lum * self._lum_weight) / self._weight_norm
 
-        self._last_frame = ContentDetector._FrameData(hue, sat, lum)
+        self._last_frame = ContentDetector._FrameData(hsv)
         return frame_score
\ No newline at end of file
@@ -1,13 +1,20 @@
 import math
-from typing import Union
+import re
+from typing import Tuple, Union
 
 MAX_FPS_DELTA: float = 1.0 / 100000
 
-_SECONDS_PER_MINUTE = 60.0
-_SECONDS_PER_HOUR = 60.0 * _SECONDS_PER_MINUTE
-_MINUTES_PER_HOUR = 60.0
+_MILLISECONDS_PER_SECOND = 1000
+_MILLISECONDS_PER_MINUTE = 60 * _MILLISECONDS_PER_SECOND
+_MILLISECONDS_PER_HOUR = 60 * _MILLISECONDS_PER_MINUTE
+
+# Frame number (9000), HH:MM:SS[.nnn] (00:05:00.000) or seconds (300s, 300.0).
+_TIMECODE_RE = re.compile(
+    r'^(?:(\d+)|(\d+):(\d+):(\d+(?:\.\d*)?)|(\d+\.\d*|\.\d+|\d+(?=s))s?)$')
 
 class FrameTimecode:
+    __slots__ = ('_framerate', '_frame_num')
+
     def __init__(
         self,
         timecode: Union[int, float, str, 'FrameTimecode'] = None,
@@ -56,35 +63,21 @@ class FrameTimecode:
     
     @property
     def seconds(self) -> float:
-        return float(self.frame_num) / self.framerate
+        return float(self._frame_num) / self._framerate
 
     @property
-    def timecode(self, precision: int = 3, use_rounding: bool = True) -> str:
+    def timecode(self) -> str:
         """
-        Get a formatted timecode string: HH:MM:SS[.nnn].
+        Get a formatted timecode string: HH:MM:SS.nnn.
         """
-        secs = self.seconds
-        hrs = int(secs / _SECONDS_PER_HOUR)
-        secs -= (hrs * _SECONDS_PER_HOUR)
-        mins = int(secs / _SECONDS_PER_MINUTE)
-        secs = max(0.0, secs - (mins * _SECONDS_PER_MINUTE))
-        if use_rounding:
-            secs = round(secs, precision)
-        secs = min(_SECONDS_PER_MINUTE, secs)
-        if int(secs) == _SECONDS_PER_MINUTE:
-            secs = 0.0
-            mins += 1
-            if mins >= _MINUTES_PER_HOUR:
-                mins = 0
-                hrs += 1
-        
-        msec = format(secs, '.%df' % (precision + 1)) if precision else ''
-        msec_str = msec[-(2 + precision):-1]
-        secs_str = f"{int(secs):02d}{msec_str}"
-        return '{:02d}:{:02d}:{}'.format(hrs, mins, secs_str)
+        total_ms = int(self._frame_num * _MILLISECONDS_PER_SECOND / self._framerate + 0.5)
+        hrs, total_ms = divmod(total_ms, _MILLISECONDS_PER_HOUR)
+        mins, total_ms = divmod(total_ms, _MILLISECONDS_PER_MINUTE)
+        secs, msec = divmod(total_ms, _MILLISECONDS_PER_SECOND)
+        return f"{hrs:02d}:{mins:02d}:{secs:02d}.{msec:03d}"
 
     def equal_framerate(self, fps: float) -> bool:
-        return math.fabs(self.framerate - fps) < MAX_FPS_DELTA
+        return math.fabs(self._framerate - fps) < MAX_FPS_DELTA
 
     def _parse_timecode_string(self, input: str) -> int:
         """
@@ -96,32 +89,23 @@ class FrameTimecode:
           - 300s
           - 300.0
         """
-        input = input.strip()
-        if input.isdigit():
-            timecode = int(input)
-            if timecode < 0:
-                raise ValueError('Timecode frame number must be positive.')
-            return timecode
-        
-        elif input.find(':') >= 0:
-            values = input.split(":")
-            hrs, mins = int(values[0]), int(values[1])
-            secs = float(values[2]) if '.' in values[2] else int(values[2])
-            if not (hrs >= 0 and mins >= 0 and secs >= 0 and mins < 60 and secs < 60):
+        match = _TIMECODE_RE.match(input.strip())
+        if match is None:
+            raise ValueError('Timecode string format unrecognized: {}'.format(input))
+
+        frames, hrs, mins, secs, seconds = match.groups()
+        if frames is not None:
+            return int(frames)
+
+        if hrs is not None:
+            hrs, mins = int(hrs), int(mins)
+            secs = float(secs) if '.' in secs else int(secs)
+            if not (mins < 60 and secs < 60):
                 raise ValueError('Invalid timecode range (values outside allowed range).')
             secs += (hrs * 60 * 60) + (mins * 60)
             return self._seconds_to_frames(secs)
 
-        if input.endswith('s'):
-            input = input[:-1]
-        
-        if not input.replace('.', '').isdigit():
-            raise ValueError('All characters in timecode seconds string must be digits.')
-
-        as_float = float(input)
-        if as_float < 0.0:
-            raise ValueError('Timecode seconds value must be positive.')
-        return self._seconds_to_frames(as_float)
+        return self._seconds_to_frames(float(seconds))
 
     def _parse_timecode_number(self, timecode: Union[int, float]) -> int:
         """
@@ -145,24 +129,27 @@ class FrameTimecode:
             raise TypeError('Timecode format/type unrecognized.')
     
     def _seconds_to_frames(self, seconds: float) -> int:
-        return round(seconds * self.framerate)
+        return round(seconds * self._framerate)
 
     def __iadd__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
+        if type(other) is int:
+            self._frame_num = max(0, self._frame_num + other)
+            return self
         if isinstance(other, int):
-            self.frame_num += other
+            self._frame_num += other
         elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num += other.frame_num
+            if self.equal_framerate(other._framerate):
+                self._frame_num += other._frame_num
             else:
                 raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
         elif isinstance(other, float):
-            self.frame_num += self._seconds_to_frames(other)
+            self._frame_num += self._seconds_to_frames(other)
         elif isinstance(other, str):
-            self.frame_num += self._parse_timecode_string(other)
+            self._frame_num += self._parse_timecode_string(other)
         else:
             raise TypeError('Unsupported type for addition. {}'.format(type))
-        if self.frame_num < 0:
-            self.frame_num = 0
+        if self._frame_num < 0:
+            self._frame_num = 0
         return self
 
     def __add__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
@@ -171,21 +158,24 @@ class FrameTimecode:
         return to_return
 
     def __isub__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
+        if type(other) is int:
+            self._frame_num = max(0, self._frame_num - other)
+            return self
         if isinstance(other, int):
-            self.frame_num -= other
+            self._frame_num -= other
         elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num -= other.frame_num
+            if self.equal_framerate(other._framerate):
+                self._frame_num -= other._frame_num
             else:
                 raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
         elif isinstance(other, float):
-            self.frame_num -= self._seconds_to_frames(other)
+            self._frame_num -= self._seconds_to_frames(other)
         elif isinstance(other, str):
-            self.frame_num -= self._parse_timecode_string(other)
+            self._frame_num -= self._parse_timecode_string(other)
         else:
             raise TypeError('Unsupported type for addition: {}'.format(type))
-        if self.frame_num < 0:
-            self.frame_num = 0
+        if self._frame_num < 0:
+            self._frame_num = 0
         return self
 
     def __sub__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
@@ -193,88 +183,75 @@ class FrameTimecode:
         to_return -= other
         return to_return
 
-    def __eq__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
+    def _comparison_operands(
+        self,
+        other: Union[int, float, str, 'FrameTimecode'],
+    ) -> Tuple[Union[int, float], Union[int, float]]:
+        """
+        Get the pair of values to compare `self` and `other` with.
+        """
         if isinstance(other, int):
-            return self.frame_num == other
+            return self._frame_num, other
         elif isinstance(other, float):
-            return self.get_seconds() == other
+            return self.seconds, other
         elif isinstance(other, str):
-            return self.frame_num == self._parse_timecode_string(other)
+            return self._frame_num, self._parse_timecode_string(other)
         elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num == other.frame_num
-            else:
-                raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
-        elif other is None:
+            if self.equal_framerate(other._framerate):
+                return self._frame_num, other._frame_num
+            raise ValueError('FrameTimecode instances require equal framerate for comparison.')
+        raise TypeError('Unsupported type for comparison: {}'.format(type(other)))
+
+    # Comparisons against int and FrameTimecode are the hot cases (frame positions),
+    # so they are checked by exact type before falling back to _comparison_operands.
+
+    def __eq__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
+        if type(other) is int:
+            return self._frame_num == other
+        if type(other) is FrameTimecode and other._framerate == self._framerate:
+            return self._frame_num == other._frame_num
+        if other is None:
             return False
-        else:
-            raise TypeError('Unsupported type for performing equal: {}'.format(other))
+        lhs, rhs = self._comparison_operands(other)
+        return lhs == rhs
 
-    def __ne__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
+    def __ne__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
         return not self == other
     
-    def __lt__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
-        if isinstance(other, int):
-            return self.frame_num < other
-        elif isinstance(other, float):
-            return self.get_seconds() < other
-        elif isinstance(other, str):
-            return self.frame_num < self._parse_timecode_string(other)
-        elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num < other.frame_num
-            else:
-                raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
-        else:
-            raise TypeError('Unsupported type for performing equal: {}'.format(other))
+    def __lt__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
+        if type(other) is int:
+            return self._frame_num < other
+        if type(other) is FrameTimecode and other._framerate == self._framerate:
+            return self._frame_num < other._frame_num
+        lhs, rhs = self._comparison_operands(other)
+        return lhs < rhs
 
-    def __lt__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
-        if isinstance(other, int):
-            return self.frame_num <= other
-        elif isinstance(other, float):
-            return self.get_seconds() <= other
-        elif isinstance(other, str):
-            return self.frame_num <= self._parse_timecode_string(other)
-        elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num <= other.frame_num
-            else:
-                raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
-        else:
-            raise TypeError('Unsupported type for performing equal: {}'.format(other))
+    def __le__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
+        if type(other) is int:
+            return self._frame_num <= other
+        if type(other) is FrameTimecode and other._framerate == self._framerate:
+            return self._frame_num <= other._frame_num
+        lhs, rhs = self._comparison_operands(other)
+        return lhs <= rhs
 
-    def __gt__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
-        if isinstance(other, int):
-            return self.frame_num > other
-        elif isinstance(other, float):
-            return self.get_seconds() > other
-        elif isinstance(other, str):
-            return self.frame_num > self._parse_timecode_string(other)
-        elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num > other.frame_num
-            else:
-                raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
-        else:
-            raise TypeError('Unsupported type for performing equal: {}'.format(other))
+    def __gt__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
+        if type(other) is int:
+            return self._frame_num > other
+        if type(other) is FrameTimecode and other._framerate == self._framerate:
+            return self._frame_num > other._frame_num
+        lhs, rhs = self._comparison_operands(other)
+        return lhs > rhs
 
-    def __ge__(self, other: Union[int, float, str, 'FrameTimecode']) -> 'FrameTimecode':
-        if isinstance(other, int):
-            return self.frame_num >= other
-        elif isinstance(other, float):
-            return self.get_seconds() >= other
-        elif isinstance(other, str):
-            return self.frame_num >= self._parse_timecode_string(other)
-        elif isinstance(other, FrameTimecode):
-            if self.equal_framerate(other.framerate):
-                self.frame_num >= other.frame_num
-            else:
-                raise ValueError('FrameTimecode instances require equal framerate for subtraction.')
-        else:
-            raise TypeError('Unsupported type for performing equal: {}'.format(other))
+    def __ge__(self, other: Union[int, float, str, 'FrameTimecode']) -> bool:
+        if type(other) is int:
+            return self._frame_num >= other
+        if type(other) is FrameTimecode and other._framerate == self._framerate:
+            return self._frame_num >= other._frame_num
+        lhs, rhs = self._comparison_operands(other)
+        return lhs >= rhs
 
     def __int__(self) -> int:
-        return self.frame_num
+        return self._frame_num
     
     def __float__(self) -> float:
         return self.seconds
@@ -283,7 +260,7 @@ class FrameTimecode:
         return self.timecode
     
     def __repr__(self) -> str:
-        return '{} [frame={:d}, fps={:.3f}]'.format(self.timecode, self.frame_num, self.framerate)
+        return '{} [frame={:d}, fps={:.3f}]'.format(self.timecode, self._frame_num, self._framerate)
     
     def __hash__(self) -> int:
-        return self.frame_num
\ No newline at end of file
+        return self._frame_num
\ No newline at end of file
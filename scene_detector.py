@@ -1,30 +1,44 @@
 import argparse
 
-from typing import Optional
+from typing import Optional, Union
 
-from video_stream import VideoStreamCv2
+from video_stream import VideoStreamCv2, VideoStreamPyAV
 from content_detector import ContentDetector
 from scene_manager import SceneManager
 
+VIDEO_BACKENDS = {
+    'opencv': VideoStreamCv2,
+    'pyav': VideoStreamPyAV,
+}
+
 def open_video(
     input_path: str,
     framerate: Optional[float] = None,
-) -> VideoStreamCv2:
+    hw_acceleration: bool = False,
+    backend: str = 'opencv',
+) -> Union[VideoStreamCv2, VideoStreamPyAV]:
+    if backend not in VIDEO_BACKENDS:
+        raise ValueError('Unknown backend: {}'.format(backend))
     try:
-        return VideoStreamCv2(input_path, framerate)
+        return VIDEO_BACKENDS[backend](input_path, framerate, hw_acceleration)
+    except ImportError:
+        raise
     except:
         raise Exception('Failed to open video')
 
-def main(input_path: str):
-    video = open_video(input_path)
+def main(input_path: str, hw_acceleration: bool = False, backend: str = 'opencv'):
+    video = open_video(input_path, hw_acceleration=hw_acceleration, backend=backend)
     detector = ContentDetector()
     scene_manager = SceneManager(detector)
     scene_manager.detect_scenes(video)
     scene_list = scene_manager.get_scene_list()
-    import ipdb; ipdb.set_trace()
+    for i, (start, end) in enumerate(scene_list):
+        print('Scene {:3d}: {} - {}'.format(i + 1, start.timecode, end.timecode))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--input_path', '-i', type=str, required=True, help="input video path")
+    parser.add_argument('--hw_acceleration', action='store_true', help="decode with hardware acceleration if available")
+    parser.add_argument('--backend', type=str, default='opencv', choices=list(VIDEO_BACKENDS), help="video decoding backend")
     args = parser.parse_args()
-    main(args.input_path)
\ No newline at end of file
+    main(args.input_path, args.hw_acceleration, args.backend)
\ No newline at end of file
@@ -1,4 +1,6 @@
-import queue
+import array
+import collections
+import functools
 import threading
 import cv2
 import numpy as np
@@ -10,7 +12,9 @@ from video_stream import VideoStreamCv2
 from frame_timecode import FrameTimecode
 
 DEFAULT_MIN_WIDTH: int = 256
-MAX_FRAME_QUEUE_LENGTH: int = 4
+FRAME_BATCH_SIZE: int = 4
+# Room for one batch being processed while the decoder fills the next one.
+MAX_FRAME_QUEUE_LENGTH: int = 2 * FRAME_BATCH_SIZE
 
 def compute_downscale_factor(
     frame_width: int,
@@ -38,6 +42,82 @@ def get_scenes_from_cuts(
     scene_list.append((last_cut, end_pos))
     return scene_list
 
+class SpscFrameRing:
+    """
+    Single-producer/single-consumer ring of frame slots shared by the decoder thread
+    and the detector. Only the producer writes `_tail` and only the consumer writes
+    `_head`, so handing over a slot takes no lock; the events are only waited on when
+    the ring is full or empty.
+
+    A waiting thread is only woken once `batch_size` slots are ready for it (or the ring
+    is closed), so when one side is faster it wakes up once per batch instead of once
+    per frame.
+    """
+    def __init__(
+        self,
+        capacity: int = MAX_FRAME_QUEUE_LENGTH,
+        batch_size: int = FRAME_BATCH_SIZE,
+    ):
+        assert 0 < batch_size <= capacity
+        self.frames: List[Optional[np.ndarray]] = [None] * capacity
+        # Frame number of the frame in each slot.
+        self.positions: List[int] = [0] * capacity
+        self._capacity: int = capacity
+        self._batch_size: int = batch_size
+        self._head: int = 0
+        self._tail: int = 0
+        self._closed: bool = False
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+
+    def next_write_slot(self) -> Optional[int]:
+        """
+        Get the slot to write the next frame to, waiting while the ring is full.
+        Returns None once the ring is closed.
+        """
+        while True:
+            if self._closed:
+                return None
+            if self._tail - self._head < self._capacity:
+                return self._tail % self._capacity
+            # Re-check after clearing so a wake-up between the check and the wait is not lost.
+            self._not_full.clear()
+            if self._tail - self._head < self._capacity or self._closed:
+                continue
+            self._not_full.wait()
+
+    def commit_write(self):
+        self._tail += 1
+        if self._tail - self._head >= self._batch_size and not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def next_read_slot(self) -> Optional[int]:
+        """
+        Get the slot holding the next frame, waiting while the ring is empty.
+        Returns None once the ring is closed and all frames have been read.
+        """
+        while True:
+            closed = self._closed
+            if self._head != self._tail:
+                return self._head % self._capacity
+            if closed:
+                return None
+            self._not_empty.clear()
+            if self._head != self._tail or self._closed:
+                continue
+            self._not_empty.wait()
+
+    def commit_read(self):
+        self._head += 1
+        if (self._capacity - (self._tail - self._head) >= self._batch_size
+                and not self._not_full.is_set()):
+            self._not_full.set()
+
+    def close(self):
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
 class SceneManager:
     def __init__(
         self,
@@ -45,17 +125,21 @@ class SceneManager:
     ):
         self._detector: ContentDetector = detector
         self._frame_size: Tuple[int, int] = None
-        self._start_pos: FrameTimecode = None
+        self._start_pos: Optional[int] = None
         self._last_pos: FrameTimecode = None
         self._base_timecode: Optional[FrameTimecode] = None
         self._stop = threading.Event()
-        self._frame_buffer = []
         self._frame_buffer_size = 0
-        self._cutting_list = []
+        self._frame_buffer = collections.deque(maxlen=self._frame_buffer_size + 1)
+        # Frame numbers of detected cuts, kept as plain ints until they are returned.
+        self._cutting_list = array.array('q')
+        self._frame_ring: Optional[SpscFrameRing] = None
+        self._decode_error: Optional[Exception] = None
 
     def detect_scenes(
         self,
         video: VideoStreamCv2,
+        frame_skip: int = 0,
     ):
         if video is None:
             raise TypeError("detect_scenes() missing 1 required positional argument: 'video'")
@@ -63,28 +147,52 @@ class SceneManager:
         self._base_timecode = video.base_timecode
         total_frames = video.duration.frame_num
         downscale_factor = compute_downscale_factor(video.frame_size[0])
+        # Frame size after downscaling, resolved once per video rather than per frame.
+        target_size = (video.frame_size[0] // downscale_factor,
+                       video.frame_size[1] // downscale_factor)
+        # Let the decoder emit downscaled frames if the backend supports it, in which
+        # case the resize in the decoder thread is skipped.
+        if downscale_factor > 1 and video.request_frame_size(target_size):
+            downscale_factor = 1
+        # A detector scoring the decoded luma plane does not need colour, so skip the
+        # conversion to BGR if the backend can hand over the luma plane directly.
+        if self._detector.decoded_luma:
+            video.request_grayscale()
 
-        frame_queue = queue.Queue(MAX_FRAME_QUEUE_LENGTH)
+        # Re-created here so a changed _frame_buffer_size takes effect, keeping the most
+        # recent frames.
+        self._frame_buffer = collections.deque(
+            self._frame_buffer, maxlen=self._frame_buffer_size + 1)
+        # Frame slots are preallocated by the decoder thread on the first frame.
+        ring = self._frame_ring = SpscFrameRing(MAX_FRAME_QUEUE_LENGTH, FRAME_BATCH_SIZE)
         self._stop.clear()
+        self._decode_error = None
+        # Decoding and detection overlap as their OpenCV calls release the GIL.
+        # HSV conversion stays with the detector; decoding is the bottleneck thread.
         decoder_thread = threading.Thread(
             target=SceneManager._decode_thread,
-            args=(self, video, downscale_factor, frame_queue)
+            args=(self, video, downscale_factor, target_size, frame_skip)
         )
         decoder_thread.start()
-        frame_im = None        
 
-        while not self._stop.is_set():
-            next_frame, position = frame_queue.get()
-            if next_frame is None and position is None:
-                break
-            if not next_frame is None:
-                frame_im = next_frame
-            
-            self._process_frame(position.frame_num, frame_im)
-
-        while not frame_queue.empty():
-            frame_queue.get_nowait()
-        decoder_thread.join()
+        # Bound methods and containers are looked up once, outside of the per-frame loop.
+        stop, process_frame = self._stop, self._process_frame
+        next_read_slot, commit_read = ring.next_read_slot, ring.commit_read
+        frames, positions = ring.frames, ring.positions
+        try:
+            while not stop.is_set():
+                slot = next_read_slot()
+                if slot is None:
+                    break
+                
+                process_frame(positions[slot], frames[slot])
+                commit_read()
+        finally:
+            # If stopped early or on error, the decoder may still be waiting for a free slot.
+            ring.close()
+            decoder_thread.join()
+        if self._decode_error is not None:
+            raise self._decode_error
 
         self._last_pos = video.position
         return video.frame_number
@@ -95,9 +203,9 @@ class SceneManager:
         ) -> List[Tuple[FrameTimecode, FrameTimecode]]:
         if self._base_timecode is None:
             return []       
-        cut_list = self._get_cutting_list()
+        cut_list = [self._base_timecode + cut for cut in self._get_cutting_list()]
         scene_list = get_scenes_from_cuts(cut_list=cut_list, 
-            start_pos=self._start_pos, end_pos=self._last_pos + 1)
+            start_pos=self._base_timecode + (self._start_pos or 0), end_pos=self._last_pos + 1)
 
         if not cut_list and not start_in_scene:
             scene_list = []
@@ -107,47 +215,80 @@ class SceneManager:
     def _get_cutting_list(self) -> List[int]:
         if not self._cutting_list:
             return []
-        return [self._base_timecode + cut for cut in sorted(set(self._cutting_list))]
+        # Sort and de-duplicate in C on the array's buffer, without copying it.
+        return np.unique(np.frombuffer(self._cutting_list, dtype=np.int64)).tolist()
 
     def _process_frame(
         self,
         frame_num: int,
         frame_im: np.ndarray,
     ) -> bool:
-        new_cuts = False
-        self._frame_buffer.append(frame_im)
-        self._frame_buffer = self._frame_buffer[-(self._frame_buffer_size + 1):]
+        # Ring slots are overwritten once read, so frames kept past this call are copied.
+        self._frame_buffer.append(frame_im.copy() if self._frame_buffer_size > 0 else frame_im)
         cuts = self._detector.process_frame(frame_num, frame_im)
-        self._cutting_list += cuts
-        new_cuts = True if cuts else False
-        return new_cuts
+        if not cuts:
+            return False
+        self._cutting_list.extend(cuts)
+        return True
 
     def _decode_thread(
         self,
         video: VideoStreamCv2,
         downscale_factor: int,
-        out_queue: queue.Queue
+        target_size: Tuple[int, int],
+        frame_skip: int,
     ):
-        while not self._stop.is_set():
-            frame_im = video.read()
-
-            if frame_im is False:
-                break
-
-            decoded_size = (frame_im.shape[1], frame_im.shape[0])
-            if self._frame_size is None:
-                self._frame_size = decoded_size
-            
-            if downscale_factor > 1:
-                frame_im = cv2.resize(
-                    frame_im, (round(frame_im.shape[1] / downscale_factor),
-                                round(frame_im.shape[0] / downscale_factor)),
-                    interpolation=cv2.INTER_LINEAR
-                )
-            
-            if self._start_pos is None:
-                self._start_pos = video.position
-            
-            out_queue.put((frame_im, video.position))
-        
-        out_queue.put((None, None))
\ No newline at end of file
+        ring = self._frame_ring
+        # Fixed for the whole video, so bound once outside of the per-frame loop.
+        stop, read = self._stop, video.read
+        next_write_slot, commit_write = ring.next_write_slot, ring.commit_write
+        frames, positions = ring.frames, ring.positions
+        # Crop to a multiple of the target size so INTER_AREA takes its integer-ratio path.
+        # Kept over repeated cv2.pyrDown: faster at x2 and x8, within ~7% at x4, one pass.
+        crop = (slice(target_size[1] * downscale_factor), slice(target_size[0] * downscale_factor))
+        # Not tiled by hand: the INTER_AREA path already splits rows over cv::parallel_for_.
+        resize = functools.partial(cv2.resize, dsize=target_size, interpolation=cv2.INTER_AREA)
+        # Full size frames are decoded into a single reused buffer when they are resized
+        # into the ring afterwards, otherwise straight into the ring slot.
+        decode_buf = None
+        # The first frame of the video is always scored, frames are only skipped after it.
+        skip = frame_skip if video.frame_number > 0 else 0
+        try:
+            while not stop.is_set():
+                slot = next_write_slot()
+                if slot is None:
+                    break
+
+                if downscale_factor > 1:
+                    frame_im = decode_buf = read(frame_skip=skip, dst=decode_buf)
+                else:
+                    frame_im = read(frame_skip=skip, dst=frames[slot])
+
+                if frame_im is False:
+                    break
+                skip = frame_skip
+
+                if self._frame_size is None:
+                    self._frame_size = (frame_im.shape[1], frame_im.shape[0])
+                
+                if downscale_factor > 1:
+                    if frames[slot] is None:
+                        frames[slot] = np.empty(
+                            (target_size[1], target_size[0]) + frame_im.shape[2:], dtype=np.uint8)
+                    # dst= writes into the preallocated slot; the call runs with the GIL released.
+                    resize(frame_im[crop], dst=frames[slot])
+                else:
+                    frames[slot] = frame_im
+                
+                # Passed as an int; FrameTimecodes are only built in get_scene_list.
+                frame_num = video.frame_number - 1
+                if self._start_pos is None:
+                    self._start_pos = frame_num
+                
+                positions[slot] = frame_num
+                commit_write()
+        except Exception as e:
+            # Re-raised by detect_scenes once this thread has been joined.
+            self._decode_error = e
+        finally:
+            ring.close()
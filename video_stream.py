@@ -1,11 +1,16 @@
 import os
 import cv2
-import math
 import numpy as np
 
 from typing import Optional, Tuple, Union
 from frame_timecode import FrameTimecode, MAX_FPS_DELTA
 
+try:
+    import av
+    from av.codec.hwaccel import HWAccel, hwdevices_available
+except ImportError:
+    av = None
+
 class VideoStreamCv2:
     """
     OpenCV cv2.VideoCapture backend
@@ -14,26 +19,32 @@ class VideoStreamCv2:
             self,
             path: str,
             framerate: Optional[float] = None,
+            hw_acceleration: bool = False,
+            max_decode_attempts: int = 5,
     ):
         if path is None:
             raise ValueError('Path must be specified')
         self._path = path
         self._cap: Optional[cv2.VideoCapture] = None
+        self._max_decode_attempts: int = max_decode_attempts
         self._frame_rate: Optional[float] = framerate
+        self._hw_acceleration: bool = hw_acceleration
+        self._frame_size: Tuple[int, int] = (0, 0)
+        self._total_frames: int = 0
+        self._has_grabbed: bool = False
         self._open_capture(framerate)
 
     @property
     def frame_number(self) -> int:
-        return math.trunc(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
+        return int(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
     
     @property
     def frame_rate(self) -> float:
-        return self._cap.framerate
+        return self._frame_rate
     
     @property
     def frame_size(self) -> Tuple[int, int]:
-        return (math.trunc(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                math.trunc(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        return self._frame_size
 
     @property
     def base_timecode(self) -> FrameTimecode:
@@ -47,7 +58,33 @@ class VideoStreamCv2:
 
     @property
     def duration(self) -> Optional[FrameTimecode]:
-        return self.base_timecode + math.trunc(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        return self.base_timecode + self._total_frames
+
+    def request_frame_size(self, size: Tuple[int, int]) -> bool:
+        """
+        Ask the backend to decode frames already scaled to `size` (width, height).
+        Returns True only if the backend honours it, otherwise the original size is kept.
+        """
+        original_size = self._frame_size
+        if (self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+                and self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+                and (int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                     int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))) == tuple(size)):
+            self._frame_size = tuple(size)
+            return True
+        # Partly applied or a different size picked by the backend, so undo it for frames
+        # to keep matching frame_size (and the resize planned from it).
+        self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, original_size[0])
+        self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, original_size[1])
+        return False
+
+    def request_grayscale(self) -> bool:
+        """
+        Ask the backend to decode only the luma (Y) plane instead of BGR frames.
+        Not supported: with CAP_PROP_CONVERT_RGB disabled the FFmpeg backend does return
+        the Y plane of planar YUV video, but logs a warning for every frame.
+        """
+        return False
 
     def _open_capture(
             self,
@@ -56,7 +93,12 @@ class VideoStreamCv2:
         if not os.path.exists(self._path):
             raise OSError('Video file not found.')
 
-        cap = cv2.VideoCapture(self._path)        
+        # Let the backend pick a hardware decoder (e.g. NVDEC/VAAPI) if one is
+        # available, otherwise OpenCV silently falls back to software decoding.
+        params = []
+        if self._hw_acceleration:
+            params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        cap = cv2.VideoCapture(self._path, cv2.CAP_ANY, params)
         if not cap.isOpened():
             raise OSError('Ensure file is valid video.')
 
@@ -72,32 +114,202 @@ class VideoStreamCv2:
             
         self._cap = cap
         self._frame_rate = framerate
+        # Stream properties do not change while reading, so query them only once.
+        self._frame_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        self._total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     
-    def read(self, decode: bool = True, advance: bool = True) -> Union[np.ndarray, bool]:
+    def _grab(self) -> bool:
+        """
+        Grab the next frame, re-trying a few times if a frame fails to decode before the
+        end of the video.
+        """
+        if self._cap.grab():
+            return True
+        # position < duration - 1, compared as ints against the cached frame count.
+        if max(self.frame_number - 1, 0) < self._total_frames - 1:
+            for _ in range(self._max_decode_attempts):
+                if self._cap.grab():
+                    return True
+        return False
+
+    def read(
+            self,
+            decode: bool = True,
+            advance: bool = True,
+            frame_skip: int = 0,
+            dst: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, bool]:
         """
         Read and decode the next frame as a np.ndarray.
+        If frame_skip > 0, that many frames are grabbed but not retrieved beforehand.
+        If dst has the frame's shape, the frame is decoded into it and dst is returned.
         """
         if not self._cap.isOpened():
             return False
         
         if advance:
-            has_grabbed = self._cap.grab()
-            if not has_grabbed:
-                if self.duration > 0 and self.position < (self.duration - 1):
-                    # Re-try a few times if required
-                    for _ in range(self._max_decode_attempts):
-                        has_grabbed = self._cap.grab()
-                        if has_grabbed:
-                            break
-            
-            if not has_grabbed:
-                return False
+            for _ in range(frame_skip + 1):
+                if not self._grab():
+                    return False
             self._has_grabbed = True
 
         if decode and self._has_grabbed:
-            _, frame = self._cap.retrieve()
+            _, frame = self._cap.retrieve(dst)
             return frame
 
         return self._has_grabbed
         
-            
\ No newline at end of file
+            
+class VideoStreamPyAV:
+    """
+    PyAV (FFmpeg) backend
+    """
+    def __init__(
+            self,
+            path: str,
+            framerate: Optional[float] = None,
+            hw_acceleration: bool = False,
+    ):
+        if av is None:
+            raise ImportError('PyAV is required for the pyav backend (pip install av).')
+        if path is None:
+            raise ValueError('Path must be specified')
+        self._path = path
+        self._container = None
+        self._frames = None
+        self._frame_rate: Optional[float] = framerate
+        self._hw_acceleration: bool = hw_acceleration
+        self._frame_number: int = 0
+        self._frame = None
+        self._grayscale: bool = False
+        # Size frames are scaled to by libswscale while being converted, if requested.
+        self._output_size: Optional[Tuple[int, int]] = None
+        self._open_container(framerate)
+
+    @property
+    def frame_number(self) -> int:
+        return self._frame_number
+
+    @property
+    def frame_rate(self) -> float:
+        return self._frame_rate
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        if self._output_size is not None:
+            return self._output_size
+        return (self._stream.codec_context.width, self._stream.codec_context.height)
+
+    @property
+    def base_timecode(self) -> FrameTimecode:
+        return FrameTimecode(timecode=0, fps=self._frame_rate)
+
+    @property
+    def position(self) -> FrameTimecode:
+        if self.frame_number < 1:
+            return self.base_timecode
+        return self.base_timecode + (self.frame_number - 1)
+
+    @property
+    def duration(self) -> Optional[FrameTimecode]:
+        if self._stream.frames:
+            return self.base_timecode + self._stream.frames
+        # Elementary streams (e.g. raw .h264) have neither a frame count nor a duration.
+        if self._container.duration is None:
+            return self.base_timecode + 0
+        duration_secs = float(self._container.duration) / av.time_base
+        return self.base_timecode + round(duration_secs * self._frame_rate)
+
+    def request_frame_size(self, size: Tuple[int, int]) -> bool:
+        """
+        Ask the backend to decode frames already scaled to `size` (width, height).
+        The scaling is done by libswscale in the same pass as the conversion to BGR/gray.
+        """
+        self._output_size = (int(size[0]), int(size[1]))
+        return True
+
+    def request_grayscale(self) -> bool:
+        """
+        Ask the backend to decode only the luma (Y) plane instead of BGR frames.
+        """
+        self._grayscale = True
+        return True
+
+    def _open_container(
+            self,
+            framerate: Optional[float] = None,
+    ):
+        if not os.path.exists(self._path):
+            raise OSError('Video file not found.')
+
+        # Decode on the first hardware device type which is actually in use once opened.
+        # With allow_software_fallback, av.open also succeeds if the device could not be
+        # set up, so that is detected through codec_context.is_hwaccel instead. Falls back
+        # to software decoding if no device works.
+        container = None
+        if self._hw_acceleration:
+            for device_type in hwdevices_available():
+                try:
+                    container = av.open(self._path, hwaccel=HWAccel(
+                        device_type=device_type, allow_software_fallback=True))
+                except av.FFmpegError:
+                    continue
+                if container.streams.video and container.streams.video[0].codec_context.is_hwaccel:
+                    break
+                container.close()
+                container = None
+
+        if container is None:
+            try:
+                container = av.open(self._path)
+            except av.FFmpegError:
+                raise OSError('Ensure file is valid video.')
+
+        if not container.streams.video:
+            raise OSError('Ensure file is valid video.')
+        stream = container.streams.video[0]
+        stream.thread_type = 'AUTO'
+
+        assert framerate is None or framerate > MAX_FPS_DELTA, "Framerate must be validated if set."
+        if framerate is None:
+            rate = stream.average_rate or stream.guessed_rate
+            framerate = float(rate) if rate else 0.0
+            if framerate < MAX_FPS_DELTA:
+                raise Exception("Frame rate is unavailable.")
+
+        self._container = container
+        self._stream = stream
+        self._frames = container.decode(stream)
+        self._frame_rate = framerate
+
+    def read(
+            self,
+            decode: bool = True,
+            advance: bool = True,
+            frame_skip: int = 0,
+            dst: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, bool]:
+        """
+        Read and decode the next frame as a np.ndarray.
+        If frame_skip > 0, that many frames are skipped (not converted) beforehand.
+        dst is accepted for compatibility with VideoStreamCv2 but PyAV always returns
+        a new array.
+        """
+        if advance:
+            for _ in range(frame_skip + 1):
+                try:
+                    self._frame = next(self._frames)
+                except (StopIteration, av.FFmpegError):
+                    return False
+                self._frame_number += 1
+
+        if decode and self._frame is not None:
+            fmt = 'gray' if self._grayscale else 'bgr24'
+            if self._output_size is None:
+                return self._frame.to_ndarray(format=fmt)
+            return self._frame.to_ndarray(
+                width=self._output_size[0], height=self._output_size[1],
+                format=fmt, interpolation='AREA')
+
+        return self._frame is not None